@@ -31,12 +31,13 @@ setup(
     install_requires=[
         "backports.shutil_get_terminal_size", 
         "backports.shutil_which", 
-        "braceexpand", 
-        "beautifulsoup4", 
-        "natsort", 
-        "Pygments>=2.7.1", 
-        "PyPDF2", 
-        "requests", 
+        "braceexpand",
+        "beautifulsoup4",
+        "lxml",
+        "natsort",
+        "Pygments>=2.7.1",
+        "pikepdf>=2.14",
+        "requests",
         "six>=1.10.0", 
         "termcolor", 
         "WeasyPrint>=51"],